@@ -148,15 +148,17 @@ async def send_test_digest():
     config = ConfigManager()
     digest_generator = DigestGenerator("output")
     
+    prepared = digest_generator.prepare_digest(papers, analyses)
+    
     # Generate HTML digest for viewing
     html_file = digest_generator.generate_html_digest(
-        papers, analyses, 
+        prepared,
         title="🧪 Test AI Research Digest - ArXiv Agent Demo"
     )
     logger.info(f"📄 Generated HTML test digest: {html_file}")
     
     # Generate email content
-    email_content = digest_generator.generate_email_content(papers, analyses)
+    email_content = digest_generator.generate_email_content(prepared)
     
     # Email configuration for Gmail
     email_config = {
@@ -16,6 +16,14 @@ import aiohttp
 import re
 
 
+# Keywords that boost a paper's basic relevance score, matched as substrings
+_HIGH_VALUE_KEYWORDS = (
+    'breakthrough', 'novel', 'state-of-the-art', 'sota', 
+    'significant', 'improvement', 'outperforms', 'beats',
+    'first', 'new', 'innovative', 'groundbreaking'
+)
+
+
 @dataclass
 class ArxivPaper:
     """Represents a paper from arXiv"""
@@ -56,16 +64,20 @@ class ArxivFetcher:
     
     BASE_URL = "http://export.arxiv.org/api/query"
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.logger = logging.getLogger(__name__)
-        self.session = None
+        # A caller-provided session is shared and stays open; otherwise one is
+        # opened and closed by the async context manager
+        self.session = session
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
     
     def _parse_paper(self, entry: ET.Element) -> Optional[ArxivPaper]:
@@ -246,42 +258,35 @@ class ArxivFetcher:
                      min_relevance_score: float = 0.5) -> List[ArxivPaper]:
         """Filter papers based on various criteria"""
         filtered = []
-        exclude_keywords = exclude_keywords or ['survey', 'review', 'tutorial']
+        exclude_keywords = [k.lower() for k in exclude_keywords or ['survey', 'review', 'tutorial']]
+        now = datetime.now()
         
         for paper in papers:
             # Check for excluded keywords
             text_to_check = (paper.title + " " + paper.abstract).lower()
             
-            if any(keyword.lower() in text_to_check for keyword in exclude_keywords):
+            if any(keyword in text_to_check for keyword in exclude_keywords):
                 continue
             
-            # Add basic relevance scoring
-            relevance_score = self._calculate_relevance_score(paper)
+            # Add basic relevance scoring, reusing the lowered text
+            relevance_score = self._calculate_relevance_score(paper, text_to_check, now)
             if relevance_score >= min_relevance_score:
                 filtered.append(paper)
         
         return filtered
     
-    def _calculate_relevance_score(self, paper: ArxivPaper) -> float:
+    def _calculate_relevance_score(self, paper: ArxivPaper, text: Optional[str] = None,
+                                   now: Optional[datetime] = None) -> float:
         """Calculate relevance score for a paper (basic version)"""
         # This is a simple scoring system - can be enhanced with AI
-        score = 0.0
-        
-        high_value_keywords = [
-            'breakthrough', 'novel', 'state-of-the-art', 'sota', 
-            'significant', 'improvement', 'outperforms', 'beats',
-            'first', 'new', 'innovative', 'groundbreaking'
-        ]
-        
-        text = (paper.title + " " + paper.abstract).lower()
+        if text is None:
+            text = (paper.title + " " + paper.abstract).lower()
         
         # Boost score for high-value keywords
-        for keyword in high_value_keywords:
-            if keyword in text:
-                score += 0.2
+        score = 0.2 * sum(keyword in text for keyword in _HIGH_VALUE_KEYWORDS)
         
         # Boost for recent papers
-        days_old = (datetime.now() - paper.published).days
+        days_old = ((now or datetime.now()) - paper.published).days
         if days_old <= 1:
             score += 0.3
         elif days_old <= 3:
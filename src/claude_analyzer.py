@@ -7,13 +7,18 @@ Uses Claude Code SDK to intelligently analyze and summarize research papers.
 """
 
 import asyncio
+import hashlib
+import heapq
 import logging
 import json
 import os
 import sys
+import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, replace
+import orjson
 
 try:
     from claude_code_sdk import query, ClaudeCodeOptions
@@ -60,6 +65,63 @@ class PaperAnalysis:
         }
 
 
+class AnalysisCache:
+    """On-disk cache of paper analyses keyed by arXiv id and content hash"""
+    
+    def __init__(self, cache_dir: Path, ttl_seconds: float = 7 * 24 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(__name__)
+    
+    def _path(self, paper: ArxivPaper, research_interests: Optional[List[str]]) -> Path:
+        """Cache file for a paper; the abstract and interests are hashed so revisions miss"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(paper.abstract.encode('utf-8'))
+        for interest in research_interests or ():
+            digest.update(b"\0" + interest.encode('utf-8'))
+        safe_id = paper.id.replace('/', '_')
+        return self.cache_dir / f"{safe_id}-{digest.hexdigest()}.json"
+    
+    def get(self, paper: ArxivPaper,
+            research_interests: Optional[List[str]] = None) -> Optional[PaperAnalysis]:
+        """Return the cached analysis for a paper, or None if missing or expired"""
+        path = self._path(paper, research_interests)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return PaperAnalysis(**orjson.loads(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, orjson.JSONDecodeError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+    
+    def put(self, paper: ArxivPaper, analysis: PaperAnalysis,
+            research_interests: Optional[List[str]] = None):
+        """Store an analysis for a paper"""
+        path = self._path(paper, research_interests)
+        tmp = path.with_name(path.name + '.part')
+        try:
+            tmp.write_bytes(orjson.dumps(analysis))
+            os.replace(tmp, path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache analysis for {paper.id}: {e}")
+    
+    def prune(self):
+        """Delete entries older than the TTL"""
+        cutoff = time.time() - self.ttl_seconds
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+
+
 class ClaudeAnalyzer:
     """Uses Claude Code SDK for intelligent paper analysis"""
     
@@ -75,20 +137,18 @@ class ClaudeAnalyzer:
             max_thinking_tokens=8000
         )
         
-        # Analysis templates
-        self.analysis_prompt_template = """
-You are an expert AI research analyst. Analyze the following research paper and provide a comprehensive analysis.
-
-Paper Information:
-Title: {title}
-Authors: {authors}
-Abstract: {abstract}
-Categories: {categories}
-arXiv ID: {arxiv_id}
+        # Per-interest-set options carrying the static analysis instructions
+        self._analysis_options: Dict[Tuple[str, ...], ClaudeCodeOptions] = {}
+        
+        # Analysis templates. The instructions are identical for every paper, so they
+        # go in the system prompt where they form a stable, cacheable prefix; only the
+        # paper itself is sent as the per-request prompt.
+        self.analysis_system_prompt = """
+You are an expert AI research analyst. Analyze the research paper you are given and provide a comprehensive analysis.
 
-Please analyze this paper and provide the following information in JSON format:
+Please analyze the paper and provide the following information in JSON format:
 
-{{
+{
     "relevance_score": <float 0-1 indicating how relevant this is to current AI trends>,
     "significance_score": <float 0-1 indicating potential significance to the field>,
     "novelty_score": <float 0-1 indicating how novel/groundbreaking this work is>,
@@ -101,7 +161,7 @@ Please analyze this paper and provide the following information in JSON format:
     "connections_to_other_work": ["<related paper/concept 1>", "<related paper/concept 2>"],
     "recommended_for": ["<audience type 1>", "<audience type 2>"],
     "tags": ["<tag1>", "<tag2>", "<tag3>"]
-}}
+}
 
 Focus on:
 1. What makes this work novel or significant
@@ -111,6 +171,15 @@ Focus on:
 5. Potential limitations or concerns
 
 Be concise but thorough. Provide honest assessments of significance and relevance.
+"""
+        
+        self.analysis_prompt_template = """
+Paper Information:
+Title: {title}
+Authors: {authors}
+Abstract: {abstract}
+Categories: {categories}
+arXiv ID: {arxiv_id}
 """
         
         self.batch_analysis_prompt = """
@@ -129,6 +198,35 @@ Please provide:
 Format your response as structured analysis focusing on actionable insights for AI researchers and practitioners.
 """
     
+    def _options_for(self, research_interests: Optional[List[str]]) -> ClaudeCodeOptions:
+        """Options whose system prompt holds the analysis instructions for these interests"""
+        key = tuple(research_interests or ())
+        options = self._analysis_options.get(key)
+        if options is None:
+            system_prompt = self.analysis_system_prompt
+            if key:
+                system_prompt += f"\nUser's research interests: {', '.join(key)}"
+                system_prompt += "\nConsider relevance to these specific interests in your analysis.\n"
+            options = replace(self.claude_options, append_system_prompt=system_prompt)
+            self._analysis_options[key] = options
+        return options
+    
+    async def _collect_text(self, prompt: str,
+                            options: Optional[ClaudeCodeOptions] = None) -> str:
+        """Run a Claude query and join the text content of every response message"""
+        responses = []
+        async for message in query(prompt=prompt, options=options or self.claude_options):
+            content = getattr(message, 'content', None)
+            if isinstance(content, str):
+                responses.append(content)
+            elif isinstance(content, (list, tuple)):
+                for block in content:
+                    text = getattr(block, 'text', None)
+                    if text is not None:
+                        responses.append(text)
+        
+        return " ".join(responses)
+    
     async def analyze_paper(self, paper: ArxivPaper, 
                            research_interests: List[str] = None) -> Optional[PaperAnalysis]:
         """Analyze a single paper using Claude"""
@@ -142,30 +240,15 @@ Format your response as structured analysis focusing on actionable insights for
                 arxiv_id=paper.id
             )
             
-            if research_interests:
-                prompt += f"\n\nUser's research interests: {', '.join(research_interests)}"
-                prompt += "\nConsider relevance to these specific interests in your analysis."
-            
             self.logger.info(f"Analyzing paper: {paper.title[:50]}...")
             
             # Query Claude
-            responses = []
-            async for message in query(prompt=prompt, options=self.claude_options):
-                if hasattr(message, 'content'):
-                    if isinstance(message.content, str):
-                        responses.append(message.content)
-                    elif hasattr(message.content, '__iter__'):
-                        for block in message.content:
-                            if hasattr(block, 'text'):
-                                responses.append(block.text)
+            full_response = await self._collect_text(prompt, self._options_for(research_interests))
             
-            if not responses:
+            if not full_response:
                 self.logger.error(f"No response from Claude for paper {paper.id}")
                 return None
             
-            # Parse the JSON response
-            full_response = " ".join(responses)
-            
             # Extract JSON from response
             json_start = full_response.find('{')
             json_end = full_response.rfind('}') + 1
@@ -233,6 +316,31 @@ Format your response as structured analysis focusing on actionable insights for
         
         return analyses
     
+    async def iter_analyses(self, papers: List[ArxivPaper],
+                            research_interests: List[str] = None,
+                            concurrency: int = 3) -> AsyncIterator[PaperAnalysis]:
+        """Analyze papers concurrently, yielding each analysis as soon as it completes"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze_with_semaphore(paper):
+            async with semaphore:
+                return await self.analyze_paper(paper, research_interests)
+        
+        tasks = [asyncio.create_task(analyze_with_semaphore(paper)) for paper in papers]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    analysis = await next_done
+                except Exception as e:
+                    self.logger.error(f"Analysis task failed: {e}")
+                    continue
+                if analysis is not None:
+                    yield analysis
+        finally:
+            # Cancel anything still pending if the consumer stops early
+            for task in tasks:
+                task.cancel()
+    
     async def identify_trends(self, analyses: List[PaperAnalysis]) -> Dict[str, Any]:
         """Use Claude to identify trends across multiple paper analyses"""
         if not analyses:
@@ -256,17 +364,7 @@ Format your response as structured analysis focusing on actionable insights for
         )
         
         try:
-            responses = []
-            async for message in query(prompt=prompt, options=self.claude_options):
-                if hasattr(message, 'content'):
-                    if isinstance(message.content, str):
-                        responses.append(message.content)
-                    elif hasattr(message.content, '__iter__'):
-                        for block in message.content:
-                            if hasattr(block, 'text'):
-                                responses.append(block.text)
-            
-            trend_analysis = " ".join(responses)
+            trend_analysis = await self._collect_text(prompt)
             
             return {
                 "analysis_date": datetime.now().isoformat(),
@@ -279,8 +377,9 @@ Format your response as structured analysis focusing on actionable insights for
             return {"error": str(e)}
     
     def rank_papers(self, analyses: List[PaperAnalysis], 
-                   criteria: str = "overall") -> List[Tuple[ArxivPaper, PaperAnalysis]]:
-        """Rank papers based on various criteria"""
+                   criteria: str = "overall",
+                   limit: Optional[int] = None) -> List[PaperAnalysis]:
+        """Rank papers based on various criteria, optionally keeping only the top `limit`"""
         
         if criteria == "relevance":
             key_func = lambda x: x.relevance_score
@@ -291,6 +390,9 @@ Format your response as structured analysis focusing on actionable insights for
         else:  # overall
             key_func = lambda x: (x.significance_score + x.novelty_score + x.relevance_score) / 3
         
+        if limit is not None:
+            return heapq.nlargest(limit, analyses, key=key_func)
+        
         ranked_analyses = sorted(analyses, key=key_func, reverse=True)
         return ranked_analyses
     
@@ -300,7 +402,7 @@ Format your response as structured analysis focusing on actionable insights for
             return "No papers analyzed today."
         
         # Get top papers
-        top_papers = self.rank_papers(analyses)[:5]
+        top_papers = self.rank_papers(analyses, limit=5)
         
         # Prepare summary data
         summary_data = {
@@ -333,17 +435,7 @@ Keep it engaging and actionable. Format in markdown.
 """
         
         try:
-            responses = []
-            async for message in query(prompt=prompt, options=self.claude_options):
-                if hasattr(message, 'content'):
-                    if isinstance(message.content, str):
-                        responses.append(message.content)
-                    elif hasattr(message.content, '__iter__'):
-                        for block in message.content:
-                            if hasattr(block, 'text'):
-                                responses.append(block.text)
-            
-            return " ".join(responses)
+            return await self._collect_text(prompt)
             
         except Exception as e:
             self.logger.error(f"Error generating daily insights: {e}")
@@ -6,28 +6,142 @@ Configuration Manager
 Manages configuration loading, validation, and environment variable handling.
 """
 
+import copy
 import os
 import logging
+import mmap
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import yaml
+from typing import Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 
+# Pattern to match ${VAR_NAME} or ${VAR_NAME:default_value}; matched on raw bytes
+_ENV_VAR_RE = re.compile(rb'\$\{([^}:]+)(?::([^}]*))?\}')
 
-@dataclass
+if os.supports_bytes_environ:
+    def _replace_env_var(match: re.Match, _env=os.environb) -> bytes:
+        """Resolve a single ${VAR_NAME[:default]} match against the environment"""
+        # _env is bound at definition time so the lookup is a local, not a global
+        var_name, default_value = match.groups(b"")
+        return _env.get(var_name, default_value)
+    
+    def _env_values(names: Tuple[bytes, ...], _env=os.environb) -> Tuple[Optional[bytes], ...]:
+        """Current values of the named environment variables"""
+        return tuple(_env.get(name) for name in names)
+else:
+    def _replace_env_var(match: re.Match, _env=os.environ) -> bytes:
+        """Resolve a single ${VAR_NAME[:default]} match against the environment"""
+        var_name, default_value = match.groups(b"")
+        value = _env.get(var_name.decode('utf-8'))
+        return default_value if value is None else value.encode('utf-8')
+    
+    def _env_values(names: Tuple[bytes, ...], _env=os.environ) -> Tuple[Optional[str], ...]:
+        """Current values of the named environment variables"""
+        return tuple(_env.get(name.decode('utf-8')) for name in names)
+
+
+# Environment variables applied by update_from_env, with pre-split config paths
+_ENV_MAPPINGS = (
+    ('ARXIV_AGENT_EMAIL_USERNAME', ('notifications', 'email', 'smtp', 'username')),
+    ('ARXIV_AGENT_EMAIL_PASSWORD', ('notifications', 'email', 'smtp', 'password')),
+    ('ARXIV_AGENT_EMAIL_FROM', ('notifications', 'email', 'smtp', 'from_email')),
+    ('ARXIV_AGENT_DISCORD_WEBHOOK', ('notifications', 'discord', 'webhook_url')),
+    ('ANTHROPIC_API_KEY', ('claude', 'api_key')),
+    ('ARXIV_AGENT_LOG_LEVEL', ('logging', 'level')),
+)
+
+# Day names accepted for schedule.weekly_summary.day, indexed like datetime.weekday()
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# Configs smaller than this are read directly; mapping them isn't worth the setup
+_MMAP_MIN_SIZE = 4096
+
+
+def _substitute(content) -> Tuple[bytes, Tuple[bytes, ...]]:
+    """Substitute environment variables, also returning the names referenced"""
+    names = tuple(dict.fromkeys(match.group(1) for match in _ENV_VAR_RE.finditer(content)))
+    return _ENV_VAR_RE.sub(_replace_env_var, content), names
+
+
+def _read_config_bytes(path: Path, size: int) -> Tuple[bytes, Tuple[bytes, ...]]:
+    """Read a config file with environment variables substituted, without decoding it"""
+    with open(path, 'rb') as f:
+        if size < _MMAP_MIN_SIZE:
+            return _substitute(f.read())
+        
+        # Run the substitution straight over the mapped file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _substitute(mm)
+
+
+# PyYAML is imported on first use; see _yaml()
+_YAML = None
+_YamlLoader = None
+_YamlDumper = None
+
+
+def _yaml():
+    """Import PyYAML lazily, preferring the libyaml-backed C loader/dumper"""
+    global _YAML, _YamlLoader, _YamlDumper
+    
+    if _YAML is None:
+        import yaml
+        
+        try:
+            from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+            backend = "libyaml"
+        except ImportError:
+            from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+            backend = "pure-python"
+        
+        logging.getLogger(__name__).debug(f"Using {backend} YAML loader")
+        _YAML = yaml
+    
+    return _YAML
+
+
+# Parsed and validated configs keyed by (resolved path, mtime_ns, size); one entry per
+# path, stored with the environment variables substituted into it and their values
+_PARSED_CACHE: Dict[tuple, Tuple[Tuple[bytes, ...], tuple, Dict[str, Any]]] = {}
+
+
+# Directories already created by this process
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: Path):
+    """Create a directory (and parents) once per process"""
+    key = str(path)
+    if key in _ENSURED_DIRS:
+        return
+    
+    path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(key)
+
+
+def _flatten(config: Dict[str, Any], prefix: str = ''):
+    """Yield (dotted_key, value) for every node in a nested config dict"""
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{path}.")
+
+
+@dataclass(frozen=True, slots=True)
 class ResearchConfig:
     """Research-specific configuration"""
-    interests: List[str] = field(default_factory=list)
-    arxiv_categories: List[str] = field(default_factory=list)
-    boost_keywords: List[str] = field(default_factory=list)
-    exclude_keywords: List[str] = field(default_factory=list)
+    interests: Tuple[str, ...] = field(default_factory=tuple)
+    arxiv_categories: Tuple[str, ...] = field(default_factory=tuple)
+    boost_keywords: Tuple[str, ...] = field(default_factory=tuple)
+    exclude_keywords: Tuple[str, ...] = field(default_factory=tuple)
     max_papers_per_day: int = 50
     days_back: int = 1
     min_relevance_score: float = 0.3
     min_significance_score: float = 0.4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScheduleConfig:
     """Scheduling configuration"""
     daily_digest_enabled: bool = True
@@ -40,7 +154,7 @@ class ScheduleConfig:
     timezone: str = "UTC"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutputConfig:
     """Output configuration"""
     directory: str = "output"
@@ -51,7 +165,7 @@ class OutputConfig:
     filename_pattern: str = "digest_{date}_{time}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
     """Email notification configuration"""
     enabled: bool = False
@@ -60,11 +174,11 @@ class EmailConfig:
     username: str = ""
     password: str = ""
     from_email: str = ""
-    recipients: List[str] = field(default_factory=list)
+    recipients: Tuple[str, ...] = field(default_factory=tuple)
     subject_template: str = "🔬 AI Research Digest - {date}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiscordConfig:
     """Discord notification configuration"""
     enabled: bool = False
@@ -72,7 +186,7 @@ class DiscordConfig:
     mention_role: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClaudeConfig:
     """Claude Code SDK configuration"""
     working_directory: str = ""
@@ -84,7 +198,7 @@ class ClaudeConfig:
     retry_attempts: int = 2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration"""
     level: str = "INFO"
@@ -99,55 +213,73 @@ class LoggingConfig:
 class ConfigManager:
     """Manages application configuration with environment variable support"""
     
-    def __init__(self, config_path: str = None):
+    __slots__ = ('config_path', 'logger', '_config', '_flat', '_views')
+    
+    def __init__(self, config_path: str = None, strict: bool = False):
         self.config_path = Path(config_path or "config/config.yaml")
         self.logger = logging.getLogger(__name__)
         self._config: Dict[str, Any] = {}
+        self._flat: Optional[Dict[str, Any]] = None
+        self._views: Dict[str, Any] = {}
         
         # Load configuration
-        self.load_config()
+        self.load_config(strict)
     
-    def load_config(self) -> Dict[str, Any]:
+    def load_config(self, strict: bool = False) -> Dict[str, Any]:
         """Load configuration from YAML file with environment variable substitution"""
+        # A missing or unreadable file falls back to the defaults; with `strict` it raises
+        self._flat = None
+        self._views = {}
+        
         try:
             if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Substitute environment variables
-                content = self._substitute_env_vars(content)
+                # Reuse a previous, already validated parse of this exact file
+                st = self.config_path.stat()
+                cache_path = str(self.config_path.resolve())
+                cache_key = (cache_path, st.st_mtime_ns, st.st_size)
+                cached = _PARSED_CACHE.get(cache_key)
                 
-                # Parse YAML
-                self._config = yaml.safe_load(content) or {}
+                # The parse is only valid while the substituted variables are unchanged
+                if cached is not None and _env_values(cached[0]) == cached[1]:
+                    self._config = copy.deepcopy(cached[2])
+                    self.logger.info(f"Loaded configuration from {self.config_path}")
+                    return self._config
+                
+                # Read and substitute environment variables
+                content, env_names = _read_config_bytes(self.config_path, st.st_size)
+                
+                # Parse YAML (libyaml decodes the UTF-8 bytes itself)
+                self._config = _yaml().load(content, Loader=_YamlLoader) or {}
                 self.logger.info(f"Loaded configuration from {self.config_path}")
+                
+                # Validate configuration
+                self._validate_config(strict)
+                
+                # Drop stale entries for this path before caching the validated result
+                for key in [k for k in _PARSED_CACHE if k[0] == cache_path]:
+                    del _PARSED_CACHE[key]
+                _PARSED_CACHE[cache_key] = (
+                    env_names, _env_values(env_names), copy.deepcopy(self._config)
+                )
             else:
+                if strict:
+                    raise FileNotFoundError(f"Config file not found: {self.config_path}")
                 self.logger.warning(f"Config file not found: {self.config_path}, using defaults")
                 self._config = self._get_default_config()
-            
-            # Validate configuration
-            self._validate_config()
+                
+                # Validate configuration
+                self._validate_config(strict)
             
             return self._config
             
         except Exception as e:
+            if strict:
+                raise
             self.logger.error(f"Error loading configuration: {e}")
             self._config = self._get_default_config()
+            self._flat = None
             return self._config
     
-    def _substitute_env_vars(self, content: str) -> str:
-        """Substitute environment variables in configuration content"""
-        import re
-        
-        # Pattern to match ${VAR_NAME} or ${VAR_NAME:default_value}
-        pattern = r'\$\{([^}:]+)(?::([^}]*))?\}'
-        
-        def replace_var(match):
-            var_name = match.group(1)
-            default_value = match.group(2) if match.group(2) is not None else ""
-            return os.getenv(var_name, default_value)
-        
-        return re.sub(pattern, replace_var, content)
-    
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
         return {
@@ -192,51 +324,68 @@ class ConfigManager:
             }
         }
     
-    def _validate_config(self):
-        """Validate configuration values"""
+    def _validate_config(self, strict: bool = False):
+        """Validate configuration values, raising instead of resetting them if `strict`"""
         # Validate research interests
         interests = self.get('research.interests', [])
         if not interests:
             self.logger.warning("No research interests defined")
         
-        # Validate schedule times
-        daily_time = self.get('schedule.daily_digest.time', '09:00')
-        if not self._is_valid_time(daily_time):
-            self.logger.error(f"Invalid daily digest time: {daily_time}")
-            self.set('schedule.daily_digest.time', '09:00')
+        # Validate schedule times, normalizing H:MM to HH:MM
+        for key, default in (('schedule.daily_digest.time', '09:00'),
+                             ('schedule.weekly_summary.time', '08:00')):
+            time_str = self.get(key, default)
+            normalized = self._normalize_time(time_str)
+            if normalized is None:
+                if strict:
+                    raise ValueError(f"Invalid schedule time for {key}: {time_str}")
+                self.logger.error(f"Invalid schedule time for {key}: {time_str}")
+                self.set(key, default)
+            elif normalized != time_str:
+                self.set(key, normalized)
+        
+        weekly_day = self.get('schedule.weekly_summary.day', 'Monday')
+        if not isinstance(weekly_day, str) or weekly_day.lower() not in WEEKDAYS:
+            if strict:
+                raise ValueError(f"Invalid weekly summary day: {weekly_day}")
+            self.logger.error(f"Invalid weekly summary day: {weekly_day}")
+            self.set('schedule.weekly_summary.day', 'Monday')
         
         # Validate output directory
-        output_dir = Path(self.get('output.directory', 'output'))
-        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(Path(self.get('output.directory', 'output')))
         
         # Validate log directory
-        log_dir = Path(self.get('logging.files.main', 'logs/agent.log')).parent
-        log_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(Path(self.get('logging.files.main', 'logs/agent.log')).parent)
     
-    def _is_valid_time(self, time_str: str) -> bool:
-        """Validate time format HH:MM"""
-        try:
-            from datetime import datetime
-            datetime.strptime(time_str, '%H:%M')
-            return True
-        except ValueError:
-            return False
+    def _normalize_time(self, time_str: Any) -> Optional[str]:
+        """Return an H:MM or HH:MM time as HH:MM, or None if it isn't one"""
+        if not isinstance(time_str, str):
+            return None
+        
+        hour, sep, minute = time_str.partition(':')
+        if not (sep and 0 < len(hour) <= 2 and 0 < len(minute) <= 2
+                and hour.isascii() and hour.isdigit() and minute.isascii() and minute.isdigit()):
+            return None
+        
+        hour, minute = int(hour), int(minute)
+        if hour >= 24 or minute >= 60:
+            return None
+        return f"{hour:02d}:{minute:02d}"
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'research.interests')"""
-        keys = key.split('.')
-        value = self._config
+        flat = self._flat
+        if flat is None:
+            flat = self._flat = dict(_flatten(self._config))
         
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation"""
-        keys = key.split('.')
+        self._set_path(key.split('.'), value)
+    
+    def _set_path(self, keys: Sequence[str], value: Any):
+        """Set configuration value from an already-split key path"""
         config = self._config
         
         # Navigate to the parent of the target key
@@ -247,112 +396,134 @@ class ConfigManager:
         
         # Set the value
         config[keys[-1]] = value
+        self._flat = None
+        self._views = {}
     
-    def get_research_config(self) -> ResearchConfig:
-        """Get research configuration as dataclass"""
+    def _build_views(self):
+        """Build every dataclass view in a single pass over the configuration"""
         research_data = self.get('research', {})
         filters = research_data.get('filters', {})
-        
-        return ResearchConfig(
-            interests=research_data.get('interests', []),
-            arxiv_categories=research_data.get('arxiv_categories', []),
-            boost_keywords=research_data.get('boost_keywords', []),
-            exclude_keywords=research_data.get('exclude_keywords', []),
-            max_papers_per_day=filters.get('max_papers_per_day', 50),
-            days_back=filters.get('days_back', 1),
-            min_relevance_score=filters.get('min_relevance_score', 0.3),
-            min_significance_score=filters.get('min_significance_score', 0.4)
-        )
-    
-    def get_schedule_config(self) -> ScheduleConfig:
-        """Get schedule configuration as dataclass"""
         daily = self.get('schedule.daily_digest', {})
         weekly = self.get('schedule.weekly_summary', {})
         monitoring = self.get('schedule.monitoring', {})
+        output_data = self.get('output', {})
+        formats = output_data.get('formats', {})
+        email_data = self.get('notifications.email', {})
+        smtp_data = email_data.get('smtp', {})
+        discord_data = self.get('notifications.discord', {})
+        claude_data = self.get('claude', {})
+        options = claude_data.get('options', {})
+        analysis = claude_data.get('analysis', {})
+        logging_data = self.get('logging', {})
+        files = logging_data.get('files', {})
+        rotation = logging_data.get('rotation', {})
+        console = logging_data.get('console', {})
         
-        return ScheduleConfig(
-            daily_digest_enabled=daily.get('enabled', True),
-            daily_digest_time=daily.get('time', '09:00'),
-            weekly_summary_enabled=weekly.get('enabled', True),
-            weekly_summary_day=weekly.get('day', 'Monday'),
-            weekly_summary_time=weekly.get('time', '08:00'),
-            monitoring_enabled=monitoring.get('enabled', False),
-            monitoring_interval_hours=monitoring.get('interval_hours', 4),
-            timezone=daily.get('timezone', 'UTC')
-        )
+        self._views = {
+            'research': ResearchConfig(
+                interests=tuple(research_data.get('interests', ())),
+                arxiv_categories=tuple(research_data.get('arxiv_categories', ())),
+                boost_keywords=tuple(research_data.get('boost_keywords', ())),
+                exclude_keywords=tuple(research_data.get('exclude_keywords', ())),
+                max_papers_per_day=filters.get('max_papers_per_day', 50),
+                days_back=filters.get('days_back', 1),
+                min_relevance_score=filters.get('min_relevance_score', 0.3),
+                min_significance_score=filters.get('min_significance_score', 0.4)
+            ),
+            'schedule': ScheduleConfig(
+                daily_digest_enabled=daily.get('enabled', True),
+                daily_digest_time=daily.get('time', '09:00'),
+                weekly_summary_enabled=weekly.get('enabled', True),
+                weekly_summary_day=weekly.get('day', 'Monday'),
+                weekly_summary_time=weekly.get('time', '08:00'),
+                monitoring_enabled=monitoring.get('enabled', False),
+                monitoring_interval_hours=monitoring.get('interval_hours', 4),
+                timezone=daily.get('timezone', 'UTC')
+            ),
+            'output': OutputConfig(
+                directory=output_data.get('directory', 'output'),
+                html=formats.get('html', True),
+                markdown=formats.get('markdown', True),
+                json=formats.get('json', True),
+                email=formats.get('email', True),
+                filename_pattern=output_data.get('filename_pattern', 'digest_{date}_{time}')
+            ),
+            'email': EmailConfig(
+                enabled=email_data.get('enabled', False),
+                smtp_server=smtp_data.get('server', 'smtp.gmail.com'),
+                smtp_port=smtp_data.get('port', 587),
+                username=smtp_data.get('username', ''),
+                password=smtp_data.get('password', ''),
+                from_email=smtp_data.get('from_email', ''),
+                recipients=tuple(email_data.get('recipients', ())),
+                subject_template=email_data.get('subject_template', '🔬 AI Research Digest - {date}')
+            ),
+            'discord': DiscordConfig(
+                enabled=discord_data.get('enabled', False),
+                webhook_url=discord_data.get('webhook_url', ''),
+                mention_role=discord_data.get('mention_role', '')
+            ),
+            'claude': ClaudeConfig(
+                working_directory=claude_data.get('working_directory', ''),
+                max_turns=options.get('max_turns', 3),
+                max_thinking_tokens=options.get('max_thinking_tokens', 8000),
+                permission_mode=options.get('permission_mode', 'acceptEdits'),
+                batch_size=analysis.get('batch_size', 5),
+                timeout_seconds=analysis.get('timeout_seconds', 300),
+                retry_attempts=analysis.get('retry_attempts', 2)
+            ),
+            'logging': LoggingConfig(
+                level=logging_data.get('level', 'INFO'),
+                main_log_file=files.get('main', 'logs/agent.log'),
+                error_log_file=files.get('errors', 'logs/errors.log'),
+                max_size_mb=rotation.get('max_size_mb', 10),
+                backup_count=rotation.get('backup_count', 5),
+                console_enabled=console.get('enabled', True),
+                console_level=console.get('level', 'INFO')
+            )
+        }
+    
+    def get_research_config(self) -> ResearchConfig:
+        """Get research configuration as dataclass"""
+        if not self._views:
+            self._build_views()
+        return self._views['research']
+    
+    def get_schedule_config(self) -> ScheduleConfig:
+        """Get schedule configuration as dataclass"""
+        if not self._views:
+            self._build_views()
+        return self._views['schedule']
     
     def get_output_config(self) -> OutputConfig:
         """Get output configuration as dataclass"""
-        output_data = self.get('output', {})
-        formats = output_data.get('formats', {})
-        
-        return OutputConfig(
-            directory=output_data.get('directory', 'output'),
-            html=formats.get('html', True),
-            markdown=formats.get('markdown', True),
-            json=formats.get('json', True),
-            email=formats.get('email', True),
-            filename_pattern=output_data.get('filename_pattern', 'digest_{date}_{time}')
-        )
+        if not self._views:
+            self._build_views()
+        return self._views['output']
     
     def get_email_config(self) -> EmailConfig:
         """Get email configuration as dataclass"""
-        email_data = self.get('notifications.email', {})
-        smtp_data = email_data.get('smtp', {})
-        
-        return EmailConfig(
-            enabled=email_data.get('enabled', False),
-            smtp_server=smtp_data.get('server', 'smtp.gmail.com'),
-            smtp_port=smtp_data.get('port', 587),
-            username=smtp_data.get('username', ''),
-            password=smtp_data.get('password', ''),
-            from_email=smtp_data.get('from_email', ''),
-            recipients=email_data.get('recipients', []),
-            subject_template=email_data.get('subject_template', '🔬 AI Research Digest - {date}')
-        )
+        if not self._views:
+            self._build_views()
+        return self._views['email']
     
     def get_discord_config(self) -> DiscordConfig:
         """Get Discord configuration as dataclass"""
-        discord_data = self.get('notifications.discord', {})
-        
-        return DiscordConfig(
-            enabled=discord_data.get('enabled', False),
-            webhook_url=discord_data.get('webhook_url', ''),
-            mention_role=discord_data.get('mention_role', '')
-        )
+        if not self._views:
+            self._build_views()
+        return self._views['discord']
     
     def get_claude_config(self) -> ClaudeConfig:
         """Get Claude configuration as dataclass"""
-        claude_data = self.get('claude', {})
-        options = claude_data.get('options', {})
-        analysis = claude_data.get('analysis', {})
-        
-        return ClaudeConfig(
-            working_directory=claude_data.get('working_directory', ''),
-            max_turns=options.get('max_turns', 3),
-            max_thinking_tokens=options.get('max_thinking_tokens', 8000),
-            permission_mode=options.get('permission_mode', 'acceptEdits'),
-            batch_size=analysis.get('batch_size', 5),
-            timeout_seconds=analysis.get('timeout_seconds', 300),
-            retry_attempts=analysis.get('retry_attempts', 2)
-        )
+        if not self._views:
+            self._build_views()
+        return self._views['claude']
     
     def get_logging_config(self) -> LoggingConfig:
         """Get logging configuration as dataclass"""
-        logging_data = self.get('logging', {})
-        files = logging_data.get('files', {})
-        rotation = logging_data.get('rotation', {})
-        console = logging_data.get('console', {})
-        
-        return LoggingConfig(
-            level=logging_data.get('level', 'INFO'),
-            main_log_file=files.get('main', 'logs/agent.log'),
-            error_log_file=files.get('errors', 'logs/errors.log'),
-            max_size_mb=rotation.get('max_size_mb', 10),
-            backup_count=rotation.get('backup_count', 5),
-            console_enabled=console.get('enabled', True),
-            console_level=console.get('level', 'INFO')
-        )
+        if not self._views:
+            self._build_views()
+        return self._views['logging']
     
     def save_config(self, output_path: str = None):
         """Save current configuration to file"""
@@ -360,7 +531,7 @@ class ConfigManager:
         
         try:
             with open(output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self._config, f, default_flow_style=False, indent=2)
+                _yaml().dump(self._config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2, sort_keys=False)
             
             self.logger.info(f"Configuration saved to {output_file}")
             
@@ -369,20 +540,11 @@ class ConfigManager:
     
     def update_from_env(self):
         """Update configuration from environment variables"""
-        env_mappings = {
-            'ARXIV_AGENT_EMAIL_USERNAME': 'notifications.email.smtp.username',
-            'ARXIV_AGENT_EMAIL_PASSWORD': 'notifications.email.smtp.password',
-            'ARXIV_AGENT_EMAIL_FROM': 'notifications.email.smtp.from_email',
-            'ARXIV_AGENT_DISCORD_WEBHOOK': 'notifications.discord.webhook_url',
-            'ANTHROPIC_API_KEY': 'claude.api_key',
-            'ARXIV_AGENT_LOG_LEVEL': 'logging.level'
-        }
-        
-        for env_var, config_key in env_mappings.items():
-            value = os.getenv(env_var)
+        for env_var, keys in _ENV_MAPPINGS:
+            value = os.environ.get(env_var)
             if value:
-                self.set(config_key, value)
-                self.logger.debug(f"Updated {config_key} from environment variable {env_var}")
+                self._set_path(keys, value)
+                self.logger.debug(f"Updated {'.'.join(keys)} from environment variable {env_var}")
 
 
 # Example usage and configuration validation
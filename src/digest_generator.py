@@ -6,65 +6,30 @@ Research Digest Generator
 Generates formatted research digests in multiple formats (HTML, Markdown, Email, Discord).
 """
 
-import json
+import asyncio
 import logging
-import smtplib
+import os
 import ssl
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email import policy
+from email.message import EmailMessage
+from email.utils import parseaddr
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, IO, Optional, Tuple
 import aiohttp
+import aiosmtplib
+import orjson
 
 from arxiv_fetcher import ArxivPaper
 from claude_analyzer import PaperAnalysis
 
 
-class DigestGenerator:
-    """Generates research digests in multiple formats"""
-    
-    def __init__(self, output_dir: str = None):
-        self.output_dir = Path(output_dir or "output")
-        
-        # Ensure directory exists and handle Windows paths via WSL
-        try:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            self.logger = logging.getLogger(__name__)
-            self.logger.info(f"📁 Output directory configured: {self.output_dir}")
-        except Exception as e:
-            self.logger = logging.getLogger(__name__)
-            self.logger.error(f"❌ Failed to create output directory {self.output_dir}: {e}")
-            # Fallback to local directory
-            self.output_dir = Path("output")
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.warning(f"⚠️  Using fallback directory: {self.output_dir}")
-    
-    def generate_html_digest(self, papers: List[ArxivPaper], 
-                           analyses: List[PaperAnalysis],
-                           title: str = "AI Research Digest") -> str:
-        """Generate HTML digest"""
-        
-        # Combine papers and analyses
-        paper_dict = {p.id: p for p in papers}
-        combined_data = []
-        
-        for analysis in analyses:
-            if analysis.paper_id in paper_dict:
-                combined_data.append((paper_dict[analysis.paper_id], analysis))
-        
-        # Sort by significance score
-        combined_data.sort(key=lambda x: x[1].significance_score, reverse=True)
-        
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
+# Static stylesheet embedded in every HTML digest
+_HTML_STYLE = """    <style>
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6;
             color: #333;
@@ -72,76 +37,76 @@ class DigestGenerator:
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
             text-align: center;
-        }}
-        .stats {{
+        }
+        .stats {
             background: white;
             padding: 20px;
             border-radius: 10px;
             margin-bottom: 30px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .paper-card {{
+        }
+        .paper-card {
             background: white;
             border-radius: 10px;
             padding: 25px;
             margin-bottom: 25px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             border-left: 5px solid #667eea;
-        }}
-        .paper-title {{
+        }
+        .paper-title {
             font-size: 1.3em;
             font-weight: bold;
             color: #2c3e50;
             margin-bottom: 10px;
-        }}
-        .paper-authors {{
+        }
+        .paper-authors {
             color: #7f8c8d;
             margin-bottom: 15px;
-        }}
-        .scores {{
+        }
+        .scores {
             display: flex;
             gap: 15px;
             margin-bottom: 15px;
-        }}
-        .score {{
+        }
+        .score {
             background: #ecf0f1;
             padding: 5px 12px;
             border-radius: 20px;
             font-size: 0.9em;
             font-weight: bold;
-        }}
-        .score.high {{ background: #2ecc71; color: white; }}
-        .score.medium {{ background: #f39c12; color: white; }}
-        .score.low {{ background: #e74c3c; color: white; }}
-        .summary {{
+        }
+        .score.high { background: #2ecc71; color: white; }
+        .score.medium { background: #f39c12; color: white; }
+        .score.low { background: #e74c3c; color: white; }
+        .summary {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 8px;
             margin: 15px 0;
             border-left: 3px solid #667eea;
-        }}
-        .insights {{
+        }
+        .insights {
             margin: 15px 0;
-        }}
-        .insight-item {{
+        }
+        .insight-item {
             background: #e8f4f8;
             padding: 10px;
             margin: 5px 0;
             border-radius: 5px;
             border-left: 3px solid #3498db;
-        }}
-        .tags {{
+        }
+        .tags {
             margin-top: 15px;
-        }}
-        .tag {{
+        }
+        .tag {
             background: #667eea;
             color: white;
             padding: 4px 8px;
@@ -150,11 +115,11 @@ class DigestGenerator:
             margin-right: 8px;
             display: inline-block;
             margin-bottom: 5px;
-        }}
-        .links {{
+        }
+        .links {
             margin-top: 15px;
-        }}
-        .link {{
+        }
+        .link {
             display: inline-block;
             background: #34495e;
             color: white;
@@ -163,20 +128,212 @@ class DigestGenerator:
             border-radius: 5px;
             margin-right: 10px;
             margin-bottom: 5px;
-        }}
-        .link:hover {{
+        }
+        .link:hover {
             background: #2c3e50;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             margin-top: 40px;
             padding: 20px;
             background: white;
             border-radius: 10px;
             color: #7f8c8d;
-        }}
+        }
     </style>
-</head>
+"""
+_HTML_STYLE_BYTES = _HTML_STYLE.encode('utf-8')
+
+
+# Score buckets indexed by how many thresholds a score clears
+_SCORE_CLASSES = ("low", "medium", "high")
+_SCORE_EMOJI = ("📄", "⭐", "🔥")
+
+# Fixed parts of every Discord webhook request; the body is serialized with orjson
+_DISCORD_BASE = {
+    "username": "AI Research Agent",
+    "avatar_url": "https://cdn-icons-png.flaticon.com/512/4712/4712027.png"
+}
+_DISCORD_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on simultaneous SMTP connections during a broadcast
+_MAX_CONCURRENT_EMAILS = 8
+
+_EMAIL_FOOTER = """
+📈 Generated by AI Research Agent
+🤖 Powered by Claude Code SDK
+
+Unsubscribe or modify preferences at your agent dashboard.
+"""
+
+
+def _score_class(score: float) -> str:
+    """CSS class for a score: low < 0.4 <= medium < 0.7 <= high"""
+    return _SCORE_CLASSES[(score >= 0.4) + (score >= 0.7)]
+
+
+def _score_emoji(score: float) -> str:
+    """Emoji marker for a significance score: 📄 < 0.6 <= ⭐ < 0.8 <= 🔥"""
+    return _SCORE_EMOJI[(score >= 0.6) + (score >= 0.8)]
+
+
+# Translation table for escaping text interpolated into the HTML digest
+_HTML_TR = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def _esc(text: Any) -> str:
+    """Escape text for HTML in a single translate pass"""
+    # Analysis fields come from Claude's JSON and may be None or non-strings
+    return str(text).translate(_HTML_TR)
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str, **kwargs) -> Iterator[IO]:
+    """Write to a sibling .part file and move it over `path` only once complete"""
+    tmp = path.with_name(path.name + '.part')
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _capped_summary(header: str, sections: Iterable[str], limit: int) -> str:
+    """Join header and whole sections until the next one would exceed limit"""
+    parts = [header]
+    total = len(header)
+    for section in sections:
+        if total + len(section) > limit:
+            parts.append("...\n\n(Truncated - check full digest)")
+            break
+        parts.append(section)
+        total += len(section)
+    
+    return "".join(parts)
+
+
+def _author_list(authors: List[str], limit: int) -> str:
+    """Join the first `limit` authors, marking any overflow with '...'"""
+    return ", ".join(authors[:limit]) + ("..." if len(authors) > limit else "")
+
+
+def _join_and_sort(papers: List[ArxivPaper],
+                   analyses: List[PaperAnalysis]) -> List[Tuple[ArxivPaper, PaperAnalysis]]:
+    """Pair each analysis with its paper, most significant first"""
+    paper_dict = {p.id: p for p in papers}
+    return sorted(
+        ((paper_dict[a.paper_id], a) for a in analyses if a.paper_id in paper_dict),
+        key=lambda pair: pair[1].significance_score,
+        reverse=True
+    )
+
+
+def _summary_stats(analyses: List[PaperAnalysis]) -> Tuple[int, int, float, Counter]:
+    """Return (total, high-significance count, average novelty, tag counts) in a single pass"""
+    high_sig_count = 0
+    novelty_total = 0.0
+    tag_counts = Counter()
+    for analysis in analyses:
+        high_sig_count += analysis.significance_score >= 0.7
+        novelty_total += analysis.novelty_score
+        tag_counts.update(analysis.tags)
+    
+    total = len(analyses)
+    return total, high_sig_count, novelty_total / total if total else 0.0, tag_counts
+
+
+@dataclass
+class PreparedDigest:
+    """Joined, sorted and summarized digest data shared by every output format"""
+    papers: List[ArxivPaper]
+    analyses: List[PaperAnalysis]
+    combined: List[Tuple[ArxivPaper, PaperAnalysis]]
+    top_papers: List[Tuple[ArxivPaper, PaperAnalysis]]  # leading slice used by the summaries
+    author_display: Dict[str, str]  # paper id -> first five authors, for the full digests
+    author_short: Dict[str, str]  # paper id -> first three authors, for the top papers only
+    total_papers: int
+    high_sig_count: int
+    avg_novelty: float
+    top_categories: str
+    generated_at: datetime
+    stamp: str  # shared filename stem so every format of one digest matches
+
+
+class DigestGenerator:
+    """Generates research digests in multiple formats"""
+    
+    def __init__(self, output_dir: str = None,
+                 session: Optional[aiohttp.ClientSession] = None):
+        self.output_dir = Path(output_dir or "output")
+        
+        # HTTP session for webhooks. A caller-provided session is shared and left open;
+        # otherwise one is created on first use and closed by aclose()
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        
+        # TLS context for SMTP, built on first send and reused for every recipient
+        self._tls_context: Optional[ssl.SSLContext] = None
+        
+        # Ensure directory exists and handle Windows paths via WSL
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.logger = logging.getLogger(__name__)
+            self.logger.info(f"📁 Output directory configured: {self.output_dir}")
+        except Exception as e:
+            self.logger = logging.getLogger(__name__)
+            self.logger.error(f"❌ Failed to create output directory {self.output_dir}: {e}")
+            # Fallback to local directory
+            self.output_dir = Path("output")
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self.logger.warning(f"⚠️  Using fallback directory: {self.output_dir}")
+    
+    def prepare_digest(self, papers: List[ArxivPaper],
+                       analyses: List[PaperAnalysis],
+                       now: Optional[datetime] = None) -> PreparedDigest:
+        """Join, sort and summarize papers once for all digest formats, stamped with `now`"""
+        total_papers, high_sig_count, avg_novelty, tag_counts = _summary_stats(analyses)
+        top_categories = ", ".join(str(tag) for tag, _ in tag_counts.most_common(5))
+        
+        combined = _join_and_sort(papers, analyses)
+        top_papers = combined[:5]
+        
+        now = now or datetime.now()
+        return PreparedDigest(
+            papers=papers,
+            analyses=analyses,
+            combined=combined,
+            top_papers=top_papers,
+            author_display={paper.id: _author_list(paper.authors, 5) for paper, _ in combined},
+            author_short={paper.id: _author_list(paper.authors, 3) for paper, _ in top_papers},
+            total_papers=total_papers,
+            high_sig_count=high_sig_count,
+            avg_novelty=avg_novelty,
+            top_categories=top_categories,
+            generated_at=now,
+            stamp=now.strftime('%Y%m%d_%H%M%S')
+        )
+    
+    def generate_html_digest(self, prepared: PreparedDigest,
+                           title: str = "AI Research Digest") -> str:
+        """Generate HTML digest, streaming each paper card straight to disk"""
+        title = _esc(title)
+        date = prepared.generated_at.strftime("%B %d, %Y at %I:%M %p")
+        output_file = self.output_dir / f"digest_{prepared.stamp}.html"
+        
+        # Binary output so the static stylesheet is written without re-encoding
+        with _atomic_open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+""".encode('utf-8'))
+            f.write(_HTML_STYLE_BYTES)
+            f.write(f"""</head>
 <body>
     <div class="header">
         <h1>{title}</h1>
@@ -185,63 +342,61 @@ class DigestGenerator:
     
     <div class="stats">
         <h2>📊 Summary Statistics</h2>
-        <p><strong>Papers Analyzed:</strong> {total_papers}</p>
-        <p><strong>High Significance Papers:</strong> {high_sig_count}</p>
-        <p><strong>Average Novelty Score:</strong> {avg_novelty:.2f}</p>
-        <p><strong>Top Research Areas:</strong> {top_categories}</p>
+        <p><strong>Papers Analyzed:</strong> {prepared.total_papers}</p>
+        <p><strong>High Significance Papers:</strong> {prepared.high_sig_count}</p>
+        <p><strong>Average Novelty Score:</strong> {prepared.avg_novelty:.2f}</p>
+        <p><strong>Top Research Areas:</strong> {_esc(prepared.top_categories) or "Various"}</p>
     </div>
     
     <div class="papers">
-        {papers_html}
+        """.encode('utf-8'))
+            
+            for paper, analysis in prepared.combined:
+                card = self._render_paper_card(paper, analysis, prepared.author_display[paper.id])
+                f.write(card.encode('utf-8'))
+            
+            f.write(f"""
     </div>
     
     <div class="footer">
         <p>Generated by AI Research Agent using Claude Code SDK</p>
-        <p>This digest analyzed {total_papers} papers from arXiv</p>
+        <p>This digest analyzed {prepared.total_papers} papers from arXiv</p>
     </div>
 </body>
 </html>
-"""
+""".encode('utf-8'))
+        
+        self.logger.info(f"Generated HTML digest: {output_file}")
+        return str(output_file)
+    
+    def _render_paper_card(self, paper: ArxivPaper, analysis: PaperAnalysis,
+                           authors: str) -> str:
+        """Render a single paper card for the HTML digest"""
+        insights_html = "".join(
+            f'<div class="insight-item">💡 {_esc(insight)}</div>' for insight in analysis.key_insights
+        )
         
-        def get_score_class(score):
-            if score >= 0.7:
-                return "high"
-            elif score >= 0.4:
-                return "medium"
-            else:
-                return "low"
+        tags_html = "".join(f'<span class="tag">{_esc(tag)}</span>' for tag in analysis.tags)
         
-        # Generate papers HTML
-        papers_html = ""
-        for paper, analysis in combined_data:
-            
-            insights_html = ""
-            for insight in analysis.key_insights:
-                insights_html += f'<div class="insight-item">💡 {insight}</div>'
-            
-            tags_html = ""
-            for tag in analysis.tags:
-                tags_html += f'<span class="tag">{tag}</span>'
-            
-            papers_html += f"""
+        return f"""
             <div class="paper-card">
-                <div class="paper-title">{paper.title}</div>
-                <div class="paper-authors">👥 {', '.join(paper.authors[:5])}{'...' if len(paper.authors) > 5 else ''}</div>
+                <div class="paper-title">{_esc(paper.title)}</div>
+                <div class="paper-authors">👥 {_esc(authors)}</div>
                 
                 <div class="scores">
-                    <div class="score {get_score_class(analysis.significance_score)}">
+                    <div class="score {_score_class(analysis.significance_score)}">
                         Significance: {analysis.significance_score:.2f}
                     </div>
-                    <div class="score {get_score_class(analysis.novelty_score)}">
+                    <div class="score {_score_class(analysis.novelty_score)}">
                         Novelty: {analysis.novelty_score:.2f}
                     </div>
-                    <div class="score {get_score_class(analysis.relevance_score)}">
+                    <div class="score {_score_class(analysis.relevance_score)}">
                         Relevance: {analysis.relevance_score:.2f}
                     </div>
                 </div>
                 
                 <div class="summary">
-                    <strong>📝 Summary:</strong> {analysis.summary}
+                    <strong>📝 Summary:</strong> {_esc(analysis.summary)}
                 </div>
                 
                 <div class="insights">
@@ -250,11 +405,11 @@ class DigestGenerator:
                 </div>
                 
                 <div>
-                    <strong>💼 Business Impact:</strong> {analysis.business_relevance}
+                    <strong>💼 Business Impact:</strong> {_esc(analysis.business_relevance)}
                 </div>
                 
                 <div>
-                    <strong>🛠️ Implementation:</strong> {analysis.implementation_difficulty}
+                    <strong>🛠️ Implementation:</strong> {_esc(analysis.implementation_difficulty)}
                 </div>
                 
                 <div class="tags">
@@ -262,79 +417,37 @@ class DigestGenerator:
                 </div>
                 
                 <div class="links">
-                    <a href="{paper.arxiv_url}" class="link" target="_blank">📄 arXiv</a>
-                    <a href="{paper.pdf_url}" class="link" target="_blank">📥 PDF</a>
+                    <a href="{_esc(paper.arxiv_url)}" class="link" target="_blank">📄 arXiv</a>
+                    <a href="{_esc(paper.pdf_url)}" class="link" target="_blank">📥 PDF</a>
                 </div>
             </div>
             """
-        
-        # Calculate statistics
-        total_papers = len(analyses)
-        high_sig_count = len([a for a in analyses if a.significance_score >= 0.7])
-        avg_novelty = sum(a.novelty_score for a in analyses) / len(analyses) if analyses else 0
-        
-        # Get top categories
-        all_tags = []
-        for analysis in analyses:
-            all_tags.extend(analysis.tags)
-        
-        from collections import Counter
-        tag_counts = Counter(all_tags)
-        top_categories = ", ".join([tag for tag, _ in tag_counts.most_common(5)])
-        
-        # Fill template
-        html_content = html_template.format(
-            title=title,
-            date=datetime.now().strftime("%B %d, %Y at %I:%M %p"),
-            total_papers=total_papers,
-            high_sig_count=high_sig_count,
-            avg_novelty=avg_novelty,
-            top_categories=top_categories or "Various",
-            papers_html=papers_html
-        )
-        
-        # Save to file
-        output_file = self.output_dir / f"digest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        self.logger.info(f"Generated HTML digest: {output_file}")
-        return str(output_file)
     
-    def generate_markdown_digest(self, papers: List[ArxivPaper], 
-                               analyses: List[PaperAnalysis],
+    def generate_markdown_digest(self, prepared: PreparedDigest,
                                title: str = "AI Research Digest") -> str:
-        """Generate Markdown digest"""
+        """Generate Markdown digest, streaming each paper section straight to disk"""
+        output_file = self.output_dir / f"digest_{prepared.stamp}.md"
         
-        # Combine and sort papers
-        paper_dict = {p.id: p for p in papers}
-        combined_data = []
-        
-        for analysis in analyses:
-            if analysis.paper_id in paper_dict:
-                combined_data.append((paper_dict[analysis.paper_id], analysis))
-        
-        combined_data.sort(key=lambda x: x[1].significance_score, reverse=True)
-        
-        # Generate markdown
-        markdown_content = f"""# {title}
-*Generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}*
+        with _atomic_open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(f"""# {title}
+*Generated on {prepared.generated_at.strftime("%B %d, %Y at %I:%M %p")}*
 
 ## 📊 Summary Statistics
-- **Papers Analyzed:** {len(analyses)}
-- **High Significance Papers:** {len([a for a in analyses if a.significance_score >= 0.7])}
-- **Average Novelty Score:** {sum(a.novelty_score for a in analyses) / len(analyses):.2f if analyses else 0}
+- **Papers Analyzed:** {prepared.total_papers}
+- **High Significance Papers:** {prepared.high_sig_count}
+- **Average Novelty Score:** {prepared.avg_novelty:.2f}
 
 ---
 
-"""
-        
-        for i, (paper, analysis) in enumerate(combined_data, 1):
-            score_emoji = "🔥" if analysis.significance_score >= 0.8 else "⭐" if analysis.significance_score >= 0.6 else "📄"
+""")
             
-            markdown_content += f"""## {score_emoji} {i}. {paper.title}
+            for i, (paper, analysis) in enumerate(prepared.combined, 1):
+                score_emoji = _score_emoji(analysis.significance_score)
+                insights_md = "".join(f"- {insight}\n" for insight in analysis.key_insights)
+                
+                f.write(f"""## {score_emoji} {i}. {paper.title}
 
-**Authors:** {', '.join(paper.authors[:5])}{'...' if len(paper.authors) > 5 else ''}
+**Authors:** {prepared.author_display[paper.id]}
 
 **Scores:** Significance: {analysis.significance_score:.2f} | Novelty: {analysis.novelty_score:.2f} | Relevance: {analysis.relevance_score:.2f}
 
@@ -342,56 +455,40 @@ class DigestGenerator:
 {analysis.summary}
 
 ### 🔍 Key Insights
-"""
-            for insight in analysis.key_insights:
-                markdown_content += f"- {insight}\n"
-            
-            markdown_content += f"""
+{insights_md}
 ### 💼 Business Impact
 {analysis.business_relevance}
 
 ### 🛠️ Implementation
 {analysis.implementation_difficulty}
 
-**Tags:** {', '.join(analysis.tags)}
+**Tags:** {', '.join(map(str, analysis.tags))}
 
 **Links:** [arXiv]({paper.arxiv_url}) | [PDF]({paper.pdf_url})
 
 ---
 
-"""
-        
-        # Save to file
-        output_file = self.output_dir / f"digest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+""")
         
         self.logger.info(f"Generated Markdown digest: {output_file}")
         return str(output_file)
     
-    def generate_email_content(self, papers: List[ArxivPaper], 
-                             analyses: List[PaperAnalysis]) -> str:
-        """Generate email-friendly content"""
-        
-        # Sort by significance
-        paper_dict = {p.id: p for p in papers}
-        sorted_analyses = sorted(analyses, key=lambda x: x.significance_score, reverse=True)
-        
-        email_content = f"""📚 AI Research Digest - {datetime.now().strftime("%B %d, %Y")}
+    def _email_header(self, prepared: PreparedDigest) -> str:
+        """Render the heading shared by the email and Discord summaries"""
+        return f"""📚 AI Research Digest - {prepared.generated_at.strftime("%B %d, %Y")}
 
-🔬 {len(analyses)} papers analyzed | 🔥 {len([a for a in analyses if a.significance_score >= 0.7])} high-significance papers
+🔬 {prepared.total_papers} papers analyzed | 🔥 {prepared.high_sig_count} high-significance papers
 
 """
+    
+    def _email_section(self, i: int, paper: ArxivPaper, analysis: PaperAnalysis,
+                       authors: str) -> str:
+        """Render one paper entry of the plain-text summary"""
+        score_indicator = _score_emoji(analysis.significance_score)
         
-        for i, analysis in enumerate(sorted_analyses[:5], 1):
-            if analysis.paper_id in paper_dict:
-                paper = paper_dict[analysis.paper_id]
-                
-                score_indicator = "🔥" if analysis.significance_score >= 0.8 else "⭐" if analysis.significance_score >= 0.6 else "📄"
-                
-                email_content += f"""{score_indicator} {i}. {paper.title}
+        return f"""{score_indicator} {i}. {paper.title}
 
-👥 {', '.join(paper.authors[:3])}{'...' if len(paper.authors) > 3 else ''}
+👥 {authors}
 📊 Significance: {analysis.significance_score:.2f} | Novelty: {analysis.novelty_score:.2f}
 
 📝 {analysis.summary}
@@ -403,35 +500,62 @@ class DigestGenerator:
 ---
 
 """
-        
-        email_content += f"""
-📈 Generated by AI Research Agent
-🤖 Powered by Claude Code SDK
-
-Unsubscribe or modify preferences at your agent dashboard.
-"""
-        
-        return email_content
+    
+    def _email_sections(self, prepared: PreparedDigest) -> Iterator[str]:
+        """Lazily render the top papers' plain-text sections"""
+        for i, (paper, analysis) in enumerate(prepared.top_papers, 1):
+            yield self._email_section(i, paper, analysis, prepared.author_short[paper.id])
+    
+    def generate_email_content(self, prepared: PreparedDigest) -> str:
+        """Generate email-friendly content"""
+        return self._email_header(prepared) + "".join(self._email_sections(prepared)) + _EMAIL_FOOTER
+    
+    def generate_discord_content(self, prepared: PreparedDigest, limit: int = 1500) -> str:
+        """Generate the plain-text summary, stopping at whole papers once limit is reached"""
+        return _capped_summary(self._email_header(prepared), self._email_sections(prepared), limit)
+    
+    def generate_notification_content(self, prepared: PreparedDigest,
+                                      discord_limit: int = 1500) -> Tuple[str, str]:
+        """Render the email and Discord texts together, sharing one set of paper sections"""
+        header = self._email_header(prepared)
+        sections = list(self._email_sections(prepared))
+        email_content = header + "".join(sections) + _EMAIL_FOOTER
+        return email_content, _capped_summary(header, sections, discord_limit)
+    
+    def build_email(self, subject: str, content: str, from_email: str) -> bytes:
+        """Serialize everything but the To header of a digest email, once per broadcast"""
+        msg = EmailMessage()
+        msg['From'] = from_email
+        msg['Subject'] = subject
+        msg.set_content(content)
+        return msg.as_bytes(policy=policy.SMTP)
     
     async def send_email(self, subject: str, content: str, 
-                        to_email: str, smtp_config: Dict[str, Any]) -> bool:
-        """Send email digest"""
+                        to_email: str, smtp_config: Dict[str, Any],
+                        message: Optional[bytes] = None) -> bool:
+        """Send email digest, reusing a pre-built message from build_email() if given"""
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = smtp_config['from_email']
-            msg['To'] = to_email
-            msg['Subject'] = subject
+            if message is None:
+                message = self.build_email(subject, content, smtp_config['from_email'])
+            
+            # Only the To header differs between recipients
+            to_header = policy.SMTP.header_factory('To', to_email)
+            data = to_header.fold(policy=policy.SMTP).encode('ascii') + message
             
-            # Add body
-            msg.attach(MIMEText(content, 'plain'))
+            if self._tls_context is None:
+                self._tls_context = ssl.create_default_context()
             
             # Send email
-            context = ssl.create_default_context()
-            with smtplib.SMTP(smtp_config['smtp_server'], smtp_config['smtp_port']) as server:
-                server.starttls(context=context)
-                server.login(smtp_config['username'], smtp_config['password'])
-                server.sendmail(smtp_config['from_email'], to_email, msg.as_string())
+            async with aiosmtplib.SMTP(hostname=smtp_config['smtp_server'],
+                                       port=smtp_config['smtp_port'],
+                                       start_tls=False) as server:
+                await server.starttls(tls_context=self._tls_context)
+                await server.login(smtp_config['username'], smtp_config['password'])
+                await server.sendmail(
+                    parseaddr(smtp_config['from_email'])[1],
+                    [address.addr_spec for address in to_header.addresses],
+                    data
+                )
             
             self.logger.info(f"Email sent successfully to {to_email}")
             return True
@@ -447,40 +571,71 @@ Unsubscribe or modify preferences at your agent dashboard.
             if len(content) > 1900:
                 content = content[:1900] + "...\n\n(Truncated - check full digest)"
             
-            payload = {
-                "content": content,
-                "username": "AI Research Agent",
-                "avatar_url": "https://cdn-icons-png.flaticon.com/512/4712/4712027.png"
-            }
+            body = orjson.dumps({"content": content, **_DISCORD_BASE})
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
-                    if response.status == 204:
-                        self.logger.info("Discord webhook sent successfully")
-                        return True
-                    else:
-                        self.logger.error(f"Discord webhook failed: {response.status}")
-                        return False
+            if self._session is None or self._session.closed:
+                # Even if a shared session was closed under us, this one is ours to close
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+                )
+                self._owns_session = True
+            
+            async with self._session.post(webhook_url, data=body,
+                                          headers=_DISCORD_HEADERS) as response:
+                if response.status == 204:
+                    self.logger.info("Discord webhook sent successfully")
+                    return True
+                else:
+                    self.logger.error(f"Discord webhook failed: {response.status}")
+                    return False
                         
         except Exception as e:
             self.logger.error(f"Failed to send Discord webhook: {e}")
             return False
     
-    def save_json_digest(self, papers: List[ArxivPaper], 
-                        analyses: List[PaperAnalysis]) -> str:
-        """Save digest data as JSON for programmatic access"""
+    async def broadcast(self, content: str, subject: str,
+                        webhooks: List[str], recipients: List[str],
+                        smtp_config: Dict[str, Any],
+                        discord_content: Optional[str] = None) -> Tuple[List[bool], List[bool]]:
+        """Send one digest to every webhook and recipient concurrently"""
+        discord_content = content if discord_content is None else discord_content
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_EMAILS)
+        message = self.build_email(subject, content, smtp_config['from_email']) if recipients else None
+        
+        async def email_with_semaphore(recipient):
+            async with semaphore:
+                return await self.send_email(subject, content, recipient, smtp_config, message)
         
+        results = await asyncio.gather(
+            *[self.send_discord_webhook(discord_content, url) for url in webhooks],
+            *[email_with_semaphore(r) for r in recipients],
+            return_exceptions=True
+        )
+        
+        # Failed sends are already logged; report anything unexpected as a failure
+        sent = [result is True for result in results]
+        return sent[:len(webhooks)], sent[len(webhooks):]
+    
+    async def aclose(self):
+        """Close the shared HTTP session, if one was opened"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def save_json_digest(self, prepared: PreparedDigest) -> str:
+        """Save digest data as JSON for programmatic access"""
         digest_data = {
-            "generated_at": datetime.now().isoformat(),
-            "papers_count": len(papers),
-            "analyses_count": len(analyses),
-            "papers": [paper.to_dict() for paper in papers],
-            "analyses": [analysis.to_dict() for analysis in analyses]
+            "generated_at": prepared.generated_at.isoformat(),
+            "papers_count": len(prepared.papers),
+            "analyses_count": len(prepared.analyses),
+            # orjson serializes the dataclasses (and their datetimes) directly
+            "papers": prepared.papers,
+            "analyses": prepared.analyses
         }
         
-        output_file = self.output_dir / f"digest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(digest_data, f, indent=2, ensure_ascii=False)
+        output_file = self.output_dir / f"digest_{prepared.stamp}.json"
+        with _atomic_open(output_file, 'wb') as f:
+            f.write(orjson.dumps(digest_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
         
         self.logger.info(f"Saved JSON digest: {output_file}")
         return str(output_file)
@@ -502,10 +657,11 @@ async def main():
     generator = DigestGenerator()
     
     if papers and analyses:
-        # Generate multiple formats
-        html_file = generator.generate_html_digest(papers, analyses)
-        md_file = generator.generate_markdown_digest(papers, analyses)
-        json_file = generator.save_json_digest(papers, analyses)
+        # Generate multiple formats from one prepared digest
+        prepared = generator.prepare_digest(papers, analyses)
+        html_file = generator.generate_html_digest(prepared)
+        md_file = generator.generate_markdown_digest(prepared)
+        json_file = generator.save_json_digest(prepared)
         
         print(f"Generated digests:")
         print(f"  HTML: {html_file}")
@@ -513,7 +669,7 @@ async def main():
         print(f"  JSON: {json_file}")
         
         # Example email content
-        email_content = generator.generate_email_content(papers, analyses)
+        email_content = generator.generate_email_content(prepared)
         print("\nEmail preview:")
         print(email_content[:500] + "...")
 
@@ -8,23 +8,67 @@ and generates intelligent research digests.
 """
 
 import asyncio
+import atexit
+import hashlib
 import logging
+import queue
 import signal
 import sys
 from datetime import datetime, timedelta, time as dt_time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import schedule
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Any
 import time
-import threading
+
+import aiohttp
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from arxiv_fetcher import ArxivFetcher, ArxivPaper
-from claude_analyzer import ClaudeAnalyzer, PaperAnalysis
-from digest_generator import DigestGenerator
-from config_manager import ConfigManager
+from claude_analyzer import AnalysisCache, ClaudeAnalyzer, PaperAnalysis
+from digest_generator import DigestGenerator, PreparedDigest
+from config_manager import WEEKDAYS, ConfigManager, ScheduleConfig
+
+
+# Longest single sleep in the scheduler. Timers run on the monotonic clock, which stops
+# while the host is suspended, so waits are re-checked against the wall clock this often
+_SCHEDULE_POLL_SECONDS = 60
+
+
+def _next_run(now: datetime, at: str, weekday: Optional[int] = None) -> datetime:
+    """Next local datetime after `now` matching HH:MM `at` (and `weekday`, if given)"""
+    hour, minute = map(int, at.split(':'))
+    candidate = datetime.combine(now.date(), dt_time(hour, minute))
+    if weekday is not None:
+        candidate += timedelta(days=(weekday - now.weekday()) % 7)
+    if candidate <= now:
+        candidate += timedelta(days=7 if weekday is not None else 1)
+    return candidate
+
+
+def _daily_slot(cfg: ScheduleConfig) -> Optional[Tuple[str, Optional[int]]]:
+    """(time, weekday) of the daily digest, or None while it is disabled"""
+    return (cfg.daily_digest_time, None) if cfg.daily_digest_enabled else None
+
+
+def _weekly_slot(cfg: ScheduleConfig) -> Optional[Tuple[str, Optional[int]]]:
+    """(time, weekday) of the weekly summary, or None while it is disabled"""
+    if not cfg.weekly_summary_enabled:
+        return None
+    return cfg.weekly_summary_time, WEEKDAYS.index(cfg.weekly_summary_day.lower())
+
+
+def _digest_hash(papers: List[ArxivPaper], analyses: List[PaperAnalysis]) -> str:
+    """Fingerprint of a digest's content: the papers and each analysis's scores"""
+    digest = hashlib.sha256()
+    for paper_id in sorted(paper.id for paper in papers):
+        digest.update(paper_id.encode('utf-8') + b"\0")
+    for analysis in sorted(analyses, key=lambda a: a.paper_id):
+        digest.update(
+            f"{analysis.paper_id}:{analysis.significance_score}:"
+            f"{analysis.novelty_score}:{analysis.relevance_score}\0".encode('utf-8')
+        )
+    return digest.hexdigest()
 
 
 class ResearchAgent:
@@ -33,6 +77,7 @@ class ResearchAgent:
     def __init__(self, config_path: str = None):
         # Initialize configuration
         self.config = ConfigManager(config_path)
+        self._load_configs()
         
         # Setup logging
         self.setup_logging()
@@ -42,11 +87,19 @@ class ResearchAgent:
         self.arxiv_fetcher = None
         self.claude_analyzer = None
         self.digest_generator = None
+        self.analysis_cache = None
+        self._http: Optional[aiohttp.ClientSession] = None
         
         # Agent state
         self.running = False
         self.last_run = None
         self.run_count = 0
+        self._last_digest_hash: Optional[str] = None
+        self._last_digest_files: Dict[str, str] = {}
+        self._delivered_to: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._wakeup: Optional[asyncio.Event] = None
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -54,59 +107,136 @@ class ResearchAgent:
         
         self.logger.info("🤖 ArXiv Research Agent initialized")
     
+    def _load_configs(self):
+        """Snapshot every config section so runs read attributes instead of the manager"""
+        self._research_cfg = self.config.get_research_config()
+        self._schedule_cfg = self.config.get_schedule_config()
+        self._output_cfg = self.config.get_output_config()
+        self._email_cfg = self.config.get_email_config()
+        self._discord_cfg = self.config.get_discord_config()
+        self._claude_cfg = self.config.get_claude_config()
+        self._log_cfg = self.config.get_logging_config()
+        self._cache_dir = self.config.get('performance.cache.directory', 'cache')
+        
+        # Last (date, subject) pair, so the subject template is formatted once per day
+        self._subject_cache: Optional[Tuple[str, str]] = None
+    
+    def reload_config(self):
+        """Re-read the configuration and apply it to the running agent"""
+        # Schedule, research, notification, output and cache settings apply immediately;
+        # logging and Claude settings are only read at startup and need a restart
+        try:
+            # Parse into a fresh manager so a bad file never replaces the running config
+            config = ConfigManager(self.config.config_path, strict=True)
+            schedule_config = config.get_schedule_config()
+            for slot in (_daily_slot, _weekly_slot):
+                current = slot(schedule_config)
+                if current is not None:
+                    _next_run(datetime.now(), *current)
+        except Exception as e:
+            self.logger.error(f"❌ Config reload failed, keeping the current configuration: {e}")
+            return
+        
+        self.config = config
+        self._load_configs()
+        
+        try:
+            if self.digest_generator is not None:
+                output_dir = Path(self._output_cfg.directory)
+                if output_dir != self.digest_generator.output_dir:
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    self.digest_generator.output_dir = output_dir
+            
+            if self.analysis_cache is not None:
+                cache_dir = Path(self._cache_dir) / "analyses"
+                if cache_dir != self.analysis_cache.cache_dir:
+                    self.analysis_cache = AnalysisCache(cache_dir)
+        except OSError as e:
+            self.logger.error(f"❌ Failed to apply reloaded directories: {e}")
+        
+        # Let the scheduling loops pick up new times from the reloaded config
+        if self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wake_schedulers)
+        
+        self.logger.info("🔄 Configuration reloaded")
+    
     def setup_logging(self):
         """Setup logging based on configuration"""
-        log_config = self.config.get_logging_config()
+        log_config = self._log_cfg
         
         # Create log directory
         log_dir = Path(log_config.main_log_file).parent
         log_dir.mkdir(parents=True, exist_ok=True)
         
-        # Configure logging
-        logging.basicConfig(
-            level=getattr(logging, log_config.level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_config.main_log_file),
-                logging.StreamHandler(sys.stdout) if log_config.console_enabled else logging.NullHandler()
-            ]
-        )
-        
-        # Setup log rotation
-        from logging.handlers import RotatingFileHandler
-        
-        # Replace file handler with rotating handler
+        # Like basicConfig, leave an already-configured root logger alone
         root_logger = logging.getLogger()
-        for handler in root_logger.handlers[:]:
-            if isinstance(handler, logging.FileHandler):
-                root_logger.removeHandler(handler)
+        if root_logger.handlers:
+            return
+        
+        # Configure logging with a single rotating file handler
+        from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
         
         rotating_handler = RotatingFileHandler(
             log_config.main_log_file,
             maxBytes=log_config.max_size_mb * 1024 * 1024,
             backupCount=log_config.backup_count
         )
-        rotating_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        console_handler = logging.StreamHandler(sys.stdout) if log_config.console_enabled else logging.NullHandler()
+        
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        for handler in (rotating_handler, console_handler):
+            handler.setFormatter(formatter)
+        
+        # Callers only enqueue records; a listener thread does the file and console
+        # writes, so logging never blocks the event loop on disk I/O
+        log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(
+            log_queue, rotating_handler, console_handler, respect_handler_level=True
         )
-        root_logger.addHandler(rotating_handler)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        root_logger.setLevel(getattr(logging, log_config.level.upper()))
+        root_logger.addHandler(QueueHandler(log_queue))
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         self.logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        if self._stop_event is not None:
+            # Wake the scheduling loops from their sleep
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+            self._loop.call_soon_threadsafe(self._wake_schedulers)
+    
+    def _wake_schedulers(self):
+        """Wake every scheduling loop so it re-reads the schedule or notices a stop"""
+        if self._wakeup is not None:
+            # Waiters hold the old event; later sleeps wait on the fresh one
+            wakeup, self._wakeup = self._wakeup, asyncio.Event()
+            wakeup.set()
     
     async def initialize_components(self):
         """Initialize all agent components"""
         try:
+            # One HTTP connection pool for arXiv and webhooks, kept for the agent's lifetime
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=60),
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+            self.arxiv_fetcher = ArxivFetcher(session=self._http)
+            
             # Initialize Claude analyzer
-            claude_config = self.config.get_claude_config()
+            claude_config = self._claude_cfg
             working_dir = claude_config.working_directory or str(Path.cwd())
             self.claude_analyzer = ClaudeAnalyzer(working_dir)
             
             # Initialize digest generator
-            output_config = self.config.get_output_config()
-            self.digest_generator = DigestGenerator(output_config.directory)
+            output_config = self._output_cfg
+            self.digest_generator = DigestGenerator(output_config.directory, session=self._http)
+            
+            # Reuse analyses of papers seen in the last week instead of re-querying Claude;
+            # kept out of the output directory, which holds only the digests users read
+            self.analysis_cache = AnalysisCache(Path(self._cache_dir) / "analyses")
             
             self.logger.info("✅ All components initialized successfully")
             
@@ -114,27 +244,26 @@ class ResearchAgent:
             self.logger.error(f"❌ Failed to initialize components: {e}")
             raise
     
-    async def fetch_and_analyze_papers(self) -> tuple[List[ArxivPaper], List[PaperAnalysis]]:
-        """Fetch papers and perform Claude analysis"""
-        research_config = self.config.get_research_config()
+    async def fetch_and_analyze_papers(self, days_back: Optional[int] = None) -> tuple[List[ArxivPaper], List[PaperAnalysis]]:
+        """Fetch papers and perform Claude analysis, optionally overriding the lookback window"""
+        research_config = self._research_cfg
         
         # Fetch papers
         self.logger.info("📚 Fetching papers from arXiv...")
         
-        async with ArxivFetcher() as fetcher:
-            papers = await fetcher.fetch_papers(
-                categories=research_config.arxiv_categories,
-                max_results=research_config.max_papers_per_day,
-                days_back=research_config.days_back,
-                keywords=research_config.interests
-            )
-            
-            # Filter papers
-            filtered_papers = fetcher.filter_papers(
-                papers,
-                exclude_keywords=research_config.exclude_keywords,
-                min_relevance_score=research_config.min_relevance_score
-            )
+        papers = await self.arxiv_fetcher.fetch_papers(
+            categories=research_config.arxiv_categories,
+            max_results=research_config.max_papers_per_day,
+            days_back=days_back if days_back is not None else research_config.days_back,
+            keywords=research_config.interests
+        )
+        
+        # Filter papers
+        filtered_papers = self.arxiv_fetcher.filter_papers(
+            papers,
+            exclude_keywords=research_config.exclude_keywords,
+            min_relevance_score=research_config.min_relevance_score
+        )
         
         self.logger.info(f"📊 Found {len(filtered_papers)} relevant papers out of {len(papers)} total")
         
@@ -145,11 +274,35 @@ class ResearchAgent:
         # Analyze papers with Claude
         self.logger.info("🔍 Starting Claude analysis...")
         
-        analyses = await self.claude_analyzer.analyze_paper_batch(
-            filtered_papers[:10],  # Limit to top 10 for cost control
-            research_interests=research_config.interests
+        # Papers analyzed recently come from the cache; only the rest go to Claude.
+        # Cache file I/O runs in worker threads to keep the event loop free
+        cache = self.analysis_cache
+        await asyncio.to_thread(cache.prune)
+        
+        top_papers = filtered_papers[:10]  # Limit to top 10 for cost control
+        lookups = await asyncio.gather(
+            *(asyncio.to_thread(cache.get, paper, research_config.interests) for paper in top_papers)
         )
         
+        analyses = []
+        to_analyze = {}
+        for paper, cached in zip(top_papers, lookups):
+            if cached is not None:
+                analyses.append(cached)
+            else:
+                to_analyze[paper.id] = paper
+        
+        if analyses:
+            self.logger.info(f"♻️  Reusing {len(analyses)} cached analyses")
+        
+        async for analysis in self.claude_analyzer.iter_analyses(
+            list(to_analyze.values()),
+            research_interests=research_config.interests,
+            concurrency=self._claude_cfg.batch_size
+        ):
+            await asyncio.to_thread(cache.put, to_analyze[analysis.paper_id], analysis, research_config.interests)
+            analyses.append(analysis)
+        
         # Filter by significance score
         significant_analyses = [
             analysis for analysis in analyses
@@ -161,77 +314,151 @@ class ResearchAgent:
         return filtered_papers, significant_analyses
     
     async def generate_and_distribute_digest(self, papers: List[ArxivPaper], 
-                                           analyses: List[PaperAnalysis]) -> Dict[str, Any]:
-        """Generate digest in multiple formats and distribute"""
+                                           analyses: List[PaperAnalysis],
+                                           now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Generate digest in multiple formats and distribute, timestamped with the run's `now`"""
+        now = now or datetime.now()
+        
         if not papers or not analyses:
             self.logger.warning("No papers or analyses to generate digest")
             return {"status": "skipped", "reason": "no_content"}
         
-        output_config = self.config.get_output_config()
-        digest_files = {}
+        # Files written and destinations reached are tracked per digest, so a repeat of
+        # the same digest only redoes the formats and destinations that failed
+        digest_hash = _digest_hash(papers, analyses)
+        repeat = digest_hash == self._last_digest_hash
+        if not repeat:
+            self._last_digest_hash = digest_hash
+            self._last_digest_files = {}
+            self._delivered_to = set()
         
-        # Generate digest formats
-        if output_config.html:
-            html_file = self.digest_generator.generate_html_digest(papers, analyses)
-            digest_files['html'] = html_file
-            self.logger.info(f"📄 Generated HTML digest: {html_file}")
+        output_config = self._output_cfg
         
+        # Write the enabled formats concurrently; each goes to its own file
+        writers = {}
+        if output_config.html:
+            writers['html'] = (self.digest_generator.generate_html_digest, "📄 Generated HTML digest")
         if output_config.markdown:
-            md_file = self.digest_generator.generate_markdown_digest(papers, analyses)
-            digest_files['markdown'] = md_file
-            self.logger.info(f"📝 Generated Markdown digest: {md_file}")
-        
+            writers['markdown'] = (self.digest_generator.generate_markdown_digest, "📝 Generated Markdown digest")
         if output_config.json:
-            json_file = self.digest_generator.save_json_digest(papers, analyses)
-            digest_files['json'] = json_file
-            self.logger.info(f"💾 Saved JSON data: {json_file}")
+            writers['json'] = (self.digest_generator.save_json_digest, "💾 Saved JSON data")
+        writers = {fmt: writer for fmt, writer in writers.items() if fmt not in self._last_digest_files}
         
-        # Send notifications
-        notifications_sent = {}
+        recipients, webhooks = self._pending_destinations()
         
-        # Email notification
-        email_config = self.config.get_email_config()
-        if email_config.enabled and email_config.recipients:
-            email_content = self.digest_generator.generate_email_content(papers, analyses)
-            subject = email_config.subject_template.format(date=datetime.now().strftime("%Y-%m-%d"))
-            
-            for recipient in email_config.recipients:
-                success = await self.digest_generator.send_email(
-                    subject=subject,
-                    content=email_content,
-                    to_email=recipient,
-                    smtp_config={
-                        'smtp_server': email_config.smtp_server,
-                        'smtp_port': email_config.smtp_port,
-                        'username': email_config.username,
-                        'password': email_config.password,
-                        'from_email': email_config.from_email
-                    }
-                )
-                notifications_sent[f'email_{recipient}'] = success
+        if not writers and not recipients and not webhooks:
+            self.logger.info("♻️  Digest unchanged since last run, reusing previous files")
+            return {
+                "status": "cached",
+                "papers_count": len(papers),
+                "analyses_count": len(analyses),
+                "digest_files": self._last_digest_files,
+                "notifications": {},
+                "timestamp": now.isoformat()
+            }
+        
+        if repeat:
+            self.logger.info("♻️  Digest unchanged since last run, retrying what failed")
         
-        # Discord notification
-        discord_config = self.config.get_discord_config()
-        if discord_config.enabled and discord_config.webhook_url:
-            discord_content = self.digest_generator.generate_email_content(papers, analyses)[:1500]
-            success = await self.digest_generator.send_discord_webhook(
-                content=discord_content,
-                webhook_url=discord_config.webhook_url
+        # Join, sort and summarize once for every output format
+        prepared = self.digest_generator.prepare_digest(papers, analyses, now)
+        
+        # Notifications don't depend on the files, so they go out while the files are
+        # written; a failed write is reported without abandoning the sends
+        notify_task = asyncio.create_task(self._send_notifications(prepared, recipients, webhooks))
+        try:
+            written = await asyncio.gather(
+                *(asyncio.to_thread(writer, prepared) for writer, _ in writers.values()),
+                return_exceptions=True
             )
-            notifications_sent['discord'] = success
+        finally:
+            notifications_sent = await notify_task
+        
+        file_errors = {}
+        for (fmt, (_, message)), path in zip(writers.items(), written):
+            if isinstance(path, Exception):
+                file_errors[fmt] = str(path)
+                self.logger.error(f"❌ Failed to write {fmt} digest: {path}")
+            else:
+                self._last_digest_files[fmt] = path
+                self.logger.info(f"{message}: {path}")
+        
+        self._delivered_to.update(dest for dest, success in notifications_sent.items() if success)
+        if file_errors or not all(notifications_sent.values()):
+            self.logger.warning("⚠️  Digest not fully written or delivered; failed parts are retried on the next run")
         
-        return {
-            "status": "success",
+        result = {
+            "status": "partial" if file_errors else "success",
             "papers_count": len(papers),
             "analyses_count": len(analyses),
-            "digest_files": digest_files,
+            "digest_files": dict(self._last_digest_files),
             "notifications": notifications_sent,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
+        if file_errors:
+            result["file_errors"] = file_errors
+        return result
+    
+    def _email_subject(self, date: str) -> str:
+        """Email subject for a date, reusing the last result when the date repeats"""
+        if self._subject_cache is None or self._subject_cache[0] != date:
+            self._subject_cache = (date, self._email_cfg.subject_template.format(date=date))
+        return self._subject_cache[1]
+    
+    def _pending_destinations(self) -> Tuple[List[str], List[str]]:
+        """Configured email recipients and Discord webhooks the current digest hasn't reached"""
+        delivered = self._delivered_to
+        
+        email_config = self._email_cfg
+        recipients = [
+            recipient for recipient in email_config.recipients
+            if f'email_{recipient}' not in delivered
+        ] if email_config.enabled else []
+        
+        discord_config = self._discord_cfg
+        webhooks = [discord_config.webhook_url] if (
+            discord_config.enabled and discord_config.webhook_url and 'discord' not in delivered
+        ) else []
+        
+        return recipients, webhooks
+    
+    async def _send_notifications(self, prepared: PreparedDigest, recipients: List[str],
+                                  webhooks: List[str]) -> Dict[str, bool]:
+        """Broadcast the digest to the given email recipients and Discord webhooks"""
+        notifications_sent = {}
+        email_config = self._email_cfg
+        
+        if recipients or webhooks:
+            email_content, discord_content = self.digest_generator.generate_notification_content(prepared)
+            subject = self._email_subject(prepared.generated_at.strftime("%Y-%m-%d"))
+            
+            # Email and Discord sends go out concurrently
+            discord_sent, email_sent = await self.digest_generator.broadcast(
+                content=email_content,
+                subject=subject,
+                webhooks=webhooks,
+                recipients=recipients,
+                smtp_config={
+                    'smtp_server': email_config.smtp_server,
+                    'smtp_port': email_config.smtp_port,
+                    'username': email_config.username,
+                    'password': email_config.password,
+                    'from_email': email_config.from_email
+                },
+                discord_content=discord_content
+            )
+            
+            for recipient, success in zip(recipients, email_sent):
+                notifications_sent[f'email_{recipient}'] = success
+            if webhooks:
+                notifications_sent['discord'] = discord_sent[0]
+        
+        return notifications_sent
     
     async def run_daily_digest(self) -> Dict[str, Any]:
         """Run the daily digest process"""
         start_time = time.time()
+        now = datetime.now()
         self.logger.info("🚀 Starting daily digest generation...")
         
         try:
@@ -242,14 +469,14 @@ class ResearchAgent:
                 return {
                     "status": "no_content",
                     "message": "No significant papers found today",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now.isoformat()
                 }
             
             # Generate and distribute digest
-            result = await self.generate_and_distribute_digest(papers, analyses)
+            result = await self.generate_and_distribute_digest(papers, analyses, now)
             
             # Update run statistics
-            self.last_run = datetime.now()
+            self.last_run = now
             self.run_count += 1
             
             execution_time = time.time() - start_time
@@ -263,7 +490,7 @@ class ResearchAgent:
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now.isoformat()
             }
     
     async def run_weekly_summary(self) -> Dict[str, Any]:
@@ -273,16 +500,7 @@ class ResearchAgent:
         try:
             # This would analyze trends over the past week
             # For now, we'll run a regular digest with extended lookback
-            research_config = self.config.get_research_config()
-            
-            # Temporarily extend lookback to 7 days
-            original_days = research_config.days_back
-            research_config.days_back = 7
-            
-            papers, analyses = await self.fetch_and_analyze_papers()
-            
-            # Restore original setting
-            research_config.days_back = original_days
+            papers, analyses = await self.fetch_and_analyze_papers(days_back=7)
             
             if analyses:
                 # Generate trend analysis
@@ -304,60 +522,112 @@ class ResearchAgent:
             self.logger.error(f"❌ Weekly summary failed: {e}")
             return {"status": "error", "error": str(e)}
     
-    def schedule_tasks(self):
-        """Schedule recurring tasks"""
-        schedule_config = self.config.get_schedule_config()
+    async def _run_at(self, slot: Callable[[ScheduleConfig], Optional[Tuple[str, Optional[int]]]],
+                      job: Callable[[], Awaitable[Any]]):
+        """Sleep until each scheduled time and run `job` until the agent stops"""
+        # `slot` is re-read after every run and every config reload
+        last_target: Optional[datetime] = None
+        target: Optional[datetime] = None
+        target_slot = None
+        while not self._stop_event.is_set():
+            wakeup = self._wakeup
+            
+            # Keep the pending target until it runs, so a slot passed while the host was
+            # suspended still fires (late); never schedule at or before the last slot run
+            now = datetime.now()
+            try:
+                current = slot(self._schedule_cfg)
+                if current is not None and (target is None or current != target_slot):
+                    target = _next_run(max(now, last_target) if last_target else now, *current)
+                    target_slot = current
+            except Exception as e:
+                # A bad slot only disables this job; the other loop keeps running
+                self.logger.error(f"❌ Invalid schedule for {job.__name__}: {e}")
+                current = None
+            
+            # Disabled jobs sleep until the next reload
+            if current is None:
+                target = None
+                await wakeup.wait()
+                continue
+            
+            delay = (target - now).total_seconds()
+            if delay <= 0:
+                last_target, target = target, None
+                try:
+                    await job()
+                except Exception as e:
+                    self.logger.error(f"❌ Scheduled {job.__name__} failed: {e}")
+                continue
+            
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=min(delay, _SCHEDULE_POLL_SECONDS))
+            except asyncio.TimeoutError:
+                pass
+    
+    def schedule_tasks(self) -> List[Awaitable[None]]:
+        """Build the recurring task loops"""
+        schedule_config = self._schedule_cfg
         
-        # Schedule daily digest
+        # Both loops always run so a config reload can enable either job later
         if schedule_config.daily_digest_enabled:
-            schedule.every().day.at(schedule_config.daily_digest_time).do(
-                lambda: asyncio.create_task(self.run_daily_digest())
-            )
             self.logger.info(f"📅 Scheduled daily digest at {schedule_config.daily_digest_time}")
         
-        # Schedule weekly summary
         if schedule_config.weekly_summary_enabled:
-            getattr(schedule.every(), schedule_config.weekly_summary_day.lower()).at(
-                schedule_config.weekly_summary_time
-            ).do(
-                lambda: asyncio.create_task(self.run_weekly_summary())
-            )
             self.logger.info(f"📅 Scheduled weekly summary on {schedule_config.weekly_summary_day} at {schedule_config.weekly_summary_time}")
+        
+        return [
+            self._run_at(_daily_slot, self.run_daily_digest),
+            self._run_at(_weekly_slot, self.run_weekly_summary)
+        ]
     
     async def start_agent(self):
         """Start the research agent"""
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._wakeup = asyncio.Event()
         
-        await self.initialize_components()
-        
-        # Schedule tasks
-        self.schedule_tasks()
-        
-        self.logger.info("🤖 Research Agent started - monitoring for scheduled tasks...")
+        # SIGHUP reloads the config from the event loop, not inside a raw signal handler
+        if hasattr(signal, 'SIGHUP'):
+            self._loop.add_signal_handler(signal.SIGHUP, self.reload_config)
         
-        # Run scheduler in background thread
-        def run_scheduler():
-            while self.running:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-        
-        scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-        scheduler_thread.start()
-        
-        # Keep main thread alive
+        # Each loop sleeps until its next run; all of them return once a stop is requested
         try:
-            while self.running:
-                await asyncio.sleep(10)
+            await self.initialize_components()
+            
+            # Schedule tasks
+            loops = self.schedule_tasks()
+            
+            self.logger.info("🤖 Research Agent started - monitoring for scheduled tasks...")
+            
+            await asyncio.gather(self._stop_event.wait(), *loops)
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
         finally:
             self.running = False
+            self._stop_event = None
+            self._wakeup = None
+            if hasattr(signal, 'SIGHUP'):
+                self._loop.remove_signal_handler(signal.SIGHUP)
+            await self.aclose()
             self.logger.info("🛑 Research Agent stopped")
     
     async def run_once(self) -> Dict[str, Any]:
         """Run digest generation once (for testing/manual execution)"""
-        await self.initialize_components()
-        return await self.run_daily_digest()
+        try:
+            await self.initialize_components()
+            return await self.run_daily_digest()
+        finally:
+            await self.aclose()
+    
+    async def aclose(self):
+        """Close the shared HTTP session and anything holding network resources"""
+        if self.digest_generator:
+            await self.digest_generator.aclose()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
 
 
 async def main():
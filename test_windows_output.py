@@ -43,8 +43,7 @@ async def test_windows_output():
         # Test writing a file
         test_file = windows_path / f"test_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         
-        with open(test_file, 'w') as f:
-            f.write(f"""ArXiv Research Agent - Test Output
+        test_file.write_bytes(f"""ArXiv Research Agent - Test Output
 Generated: {datetime.now().isoformat()}
 
 This file confirms that the ArXiv Research Agent can successfully write to your Windows directory.
@@ -53,7 +52,7 @@ Directory: C:\\Users\\Tyvon\\OneDrive\\Documents\\TyvonneDocs\\VBE\\AI_Research
 WSL Path: /mnt/c/Users/Tyvon/OneDrive/Documents/TyvonneDocs/VBE/AI_Research
 
 ✅ File output system working correctly!
-""")
+""".encode('utf-8'))
         
         logger.info(f"✅ Test file created: {test_file}")
         
@@ -98,14 +97,14 @@ WSL Path: /mnt/c/Users/Tyvon/OneDrive/Documents/TyvonneDocs/VBE/AI_Research
 </html>"""
         
         html_file = windows_path / f"arxiv_agent_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(html_file, 'w') as f:
-            f.write(test_html)
+        html_file.write_bytes(test_html.encode('utf-8'))
         
         logger.info(f"✅ Test HTML file created: {html_file}")
         
         # List files in directory
-        files_in_dir = list(windows_path.glob("*"))
-        logger.info(f"📂 Files in Windows directory: {len(files_in_dir)}")
+        with os.scandir(windows_path) as entries:
+            file_count = sum(1 for _ in entries)
+        logger.info(f"📂 Files in Windows directory: {file_count}")
         
         return True
         